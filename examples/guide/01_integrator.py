@@ -2,6 +2,7 @@
 Simple integrator element with cosine wave input.
 """
 import numpy as np
+import scipy.integrate
 from matplotlib import pyplot as plt
 from modypy.model import State, System, signal_function
 from modypy.simulation import SimulationResult, Simulator
@@ -21,7 +22,15 @@ def cosine_input(system_state):
 integrator_state = State(system, derivative_function=cosine_input)
 
 # Set up a simulation
-simulator = Simulator(system, start_time=0.0, max_step=0.1)
+# With the limited step size, the lower-order RK45 solver is sufficient here
+simulator = Simulator(
+    system,
+    start_time=0.0,
+    max_step=0.1,
+    solver_method=scipy.integrate.RK45,
+    rtol=1e-6,
+    atol=1e-9,
+)
 
 # Run the simulation for 10s and capture the result
 result = SimulationResult(system, simulator.run_until(time_boundary=10.0))
@@ -45,12 +45,6 @@ class Propeller(Block):
                  power_coefficient,
                  diameter):
         Block.__init__(self, parent)
-        if not callable(thrust_coefficient):
-            thrust_coeff_value = thrust_coefficient
-            thrust_coefficient = (lambda n: thrust_coeff_value)
-        if not callable(power_coefficient):
-            power_coeff_value = power_coefficient
-            power_coefficient = (lambda n: power_coeff_value)
 
         self.thrust_coefficient = thrust_coefficient
         self.power_coefficient = power_coefficient
@@ -59,14 +53,63 @@ class Propeller(Block):
         self.speed_rps = Port()
         self.density = Port()
 
+    @property
+    def thrust_coefficient(self):
+        """The thrust coefficient as a function of the speed"""
+        return self._thrust_coefficient
+
+    @thrust_coefficient.setter
+    def thrust_coefficient(self, thrust_coefficient):
+        # Constant coefficients are kept separately, so that we can avoid
+        # calling the coefficient function when calculating the outputs.
+        if callable(thrust_coefficient):
+            self._thrust_coeff_value = None
+        else:
+            thrust_coeff_value = thrust_coefficient
+            thrust_coefficient = (lambda n: thrust_coeff_value)
+            self._thrust_coeff_value = thrust_coeff_value
+        self._thrust_coefficient = thrust_coefficient
+
+    @property
+    def power_coefficient(self):
+        """The power coefficient as a function of the speed"""
+        return self._power_coefficient
+
+    @power_coefficient.setter
+    def power_coefficient(self, power_coefficient):
+        if callable(power_coefficient):
+            self._power_coeff_value = None
+        else:
+            power_coeff_value = power_coefficient
+            power_coefficient = (lambda n: power_coeff_value)
+            self._power_coeff_value = power_coeff_value
+        self._power_coefficient = power_coefficient
+
+    @property
+    def diameter(self):
+        """The diameter of the propeller"""
+        return self._diameter
+
+    @diameter.setter
+    def diameter(self, diameter):
+        self._diameter = diameter
+
+        # Pre-calculate the powers of the diameter used in the formulae
+        self._diameter_4 = diameter ** 4
+        self._diameter_5 = diameter ** 5
+        self._diameter_5_by_2pi = self._diameter_5 / (2 * math.pi)
+
     @signal_method
     def thrust(self, data):
         """Function used to calculate the ``thrust`` output
         """
         speed_rps = self.speed_rps(data)
         density = self.density(data)
-        return self.thrust_coefficient(speed_rps) \
-            * density * self.diameter ** 4 * speed_rps ** 2
+        thrust_coeff = self._thrust_coeff_value
+        if thrust_coeff is None:
+            thrust_coeff = self.thrust_coefficient(speed_rps)
+        return thrust_coeff * density * self._diameter_4 * \
+            (speed_rps * speed_rps)
 
     @signal_method
     def torque(self, data):
@@ -74,8 +117,11 @@ class Propeller(Block):
         """
         speed_rps = self.speed_rps(data)
         density = self.density(data)
-        return self.power_coefficient(speed_rps) / (2 * math.pi) * \
-            density * self.diameter ** 5 * speed_rps ** 2
+        power_coeff = self._power_coeff_value
+        if power_coeff is None:
+            power_coeff = self.power_coefficient(speed_rps)
+        return power_coeff * density * self._diameter_5_by_2pi * \
+            (speed_rps * speed_rps)
 
     @signal_method
     def power(self, data):
@@ -83,8 +129,11 @@ class Propeller(Block):
         """
         speed_rps = self.speed_rps(data)
         density = self.density(data)
-        return self.power_coefficient(speed_rps) * \
-            density * self.diameter ** 5 * np.abs(speed_rps ** 3)
+        power_coeff = self._power_coeff_value
+        if power_coeff is None:
+            power_coeff = self.power_coefficient(speed_rps)
+        return power_coeff * density * self._diameter_5 * \
+            (speed_rps * speed_rps * abs(speed_rps))
 
 
 class Thruster(Block):
@@ -122,13 +171,57 @@ class Thruster(Block):
                  arm,
                  direction=1):
         Block.__init__(self, parent)
-        self.vector = vector
-        self.arm = arm
-        self.direction = direction
+        self._vector = vector
+        self._arm = arm
+        self._direction = direction
+        self._update_axes()
 
         self.scalar_thrust = Port()
         self.scalar_torque = Port()
 
+    @property
+    def vector(self):
+        """The thrust axis"""
+        return self._vector
+
+    @vector.setter
+    def vector(self, vector):
+        self._vector = vector
+        self._update_axes()
+
+    @property
+    def arm(self):
+        """The thrust arm"""
+        return self._arm
+
+    @arm.setter
+    def arm(self, arm):
+        self._arm = arm
+        self._update_axes()
+
+    @property
+    def direction(self):
+        """The turning direction"""
+        return self._direction
+
+    @direction.setter
+    def direction(self, direction):
+        self._direction = direction
+        self._update_axes()
+
+    def _update_axes(self):
+        """Determine the thrust and torque vectors per unit of scalar thrust
+        and torque"""
+
+        # The torque vectors per unit of thrust and per unit of scalar torque
+        # only depend on the configuration, so they are determined in advance
+        # instead of on each evaluation of the outputs.
+        self._thrust_axis = np.ravel(self._vector)
+        self._torque_axis = self._direction * self._thrust_axis
+        self._thrust_torque_axis = np.cross(
+            np.ravel(self._arm), self._thrust_axis
+        )
+
     # pylint does not recognize the modifications to the signal_method decorator
     # pylint: disable=no-value-for-parameter
     @signal_method(shape=3)
@@ -136,7 +229,7 @@ class Thruster(Block):
         """Function used to calculate the ``thrust_vector`` output
         """
         thrust = self.scalar_thrust(data)
-        thrust_vector = self.vector * thrust
+        thrust_vector = np.multiply.outer(self._thrust_axis, thrust)
         return thrust_vector
 
     # pylint does not recognize the modifications to the signal_method decorator
@@ -148,8 +241,9 @@ class Thruster(Block):
         thrust = self.scalar_thrust(data)
         torque = self.scalar_torque(data)
 
-        thrust_vector = self.vector * thrust
-        torque_vector = self.direction * self.vector * torque + \
-            np.cross(self.arm, thrust_vector)
+        # The torque due to the thrust working at the end of the arm is
+        # cross(arm, vector * thrust) = cross(arm, vector) * thrust
+        torque_vector = np.multiply.outer(self._torque_axis, torque) + \
+            np.multiply.outer(self._thrust_torque_axis, thrust)
 
         return torque_vector
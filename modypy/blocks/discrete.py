@@ -38,7 +38,13 @@ class ZeroOrderHold(Block):
         Args:
           data: The time, states and signals of the system
         """
-        self.output.set_value(data, self.input(data))
+        source = self.input.signal
+        if isinstance(source, State):
+            # The input is directly connected to a state, so we can simply take
+            # the respective lines of the state vector.
+            self.output.set_value(data, data.state[source.state_slice])
+        else:
+            self.output.set_value(data, self.input(data))
 
 
 def zero_order_hold(system, input_port, event_port, initial_condition=None):
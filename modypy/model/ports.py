@@ -182,32 +182,51 @@ def signal_method(user_function, *args, **kwargs):
 
     class _SignalDescriptor:
         """Descriptor that will return itself when accessed on a class, but a
-        unique Signal instance when accessed on a class instance."""
+        unique Signal instance when accessed on a class instance.
+
+        If the descriptor is known under exactly one name, the signal instance
+        is stored in the instance dictionary under that name. As this is a
+        non-data descriptor, any further access to the attribute finds the
+        signal there without invoking the descriptor again. Otherwise, i.e., if
+        the descriptor was assigned to the class after its creation or under
+        multiple names, the signal is stored in a hidden attribute."""
 
         def __init__(self, function):
             self.name = None
+            self.single_name = False
             self.function = function
 
         def __set_name__(self, owner, name):
+            self.single_name = self.name is None or (
+                self.single_name and self.name == name
+            )
             self.name = name
 
         def __get__(self, instance, owner):
             if instance is None:
                 return self
+            if self.single_name:
+                the_signal = self._create_signal(instance, owner)
+                setattr(instance, self.name, the_signal)
+                return the_signal
             signal_name = "__signal_%s" % self.name
             the_signal = getattr(instance, signal_name, None)
             if the_signal is None:
-                the_signal = Signal(
-                    *args,
-                    value=self.function.__get__(instance, owner),
-                    **kwargs
-                )
-                the_signal.__name__ = self.function.__name__
-                the_signal.__doc__ = self.function.__doc__
-                the_signal.__dict__.update(self.function.__dict__)
+                the_signal = self._create_signal(instance, owner)
                 setattr(instance, signal_name, the_signal)
             return the_signal
 
+        def _create_signal(self, instance, owner):
+            the_signal = Signal(
+                *args,
+                value=self.function.__get__(instance, owner),
+                **kwargs
+            )
+            the_signal.__name__ = self.function.__name__
+            the_signal.__doc__ = self.function.__doc__
+            the_signal.__dict__.update(self.function.__dict__)
+            return the_signal
+
     descriptor = _SignalDescriptor(user_function)
     descriptor.__name__ = user_function.__name__
     descriptor.__doc__ = user_function.__doc__
@@ -23,6 +23,10 @@ class System:
 
         self.clocks = set()
 
+        # An optional callable providing the Jacobian of the state derivative
+        # with respect to the state vector for a given system state
+        self.jacobian_function = None
+
     @property
     def system(self):
         """The system itself"""
@@ -137,6 +141,25 @@ class System:
                     np.ravel(state_instance.derivative_function(system_state))
         return state_derivative
 
+    def state_jacobian(self, system_state):
+        """Determine the Jacobian of the state derivative with respect to the
+        state vector for the given system state.
+
+        The Jacobian is provided by the ``jacobian_function`` of the system,
+        which must be set explicitly by the model.
+
+        Args:
+            system_state: The state for which to determine the Jacobian.
+
+        Returns:
+            The Jacobian matrix of shape ``(num_states, num_states)``, or
+            ``None`` if no ``jacobian_function`` is defined for this system.
+        """
+        if self.jacobian_function is None:
+            return None
+        return np.reshape(self.jacobian_function(system_state),
+                          (self.num_states, self.num_states))
+
 
 class Block:
     """A block is a re-usable building block for systems."""
@@ -148,7 +171,11 @@ class Block:
 
 class SystemState:
     """This class allows to evaluate the individual aspects (signals, state
-    derivatives, ...) of a system at any given time."""
+    derivatives, ...) of a system at any given time.
+
+    The state and input vectors may have additional trailing axes, e.g. for
+    evaluating a batch of system states at once. In that case, the values of
+    states and inputs have the same trailing axes."""
 
     def __init__(self, time, system: System, state=None, inputs=None):
         self.time = time
@@ -170,7 +197,8 @@ class SystemState:
         Returns:
           The value of the state
         """
-        return self.state[state.state_slice].reshape(state.shape)
+        return self.state[state.state_slice].reshape(
+            state.shape + self.state.shape[1:])
 
     def get_input_value(self, signal):
         """Determine the value of a given input signal.
@@ -181,7 +209,8 @@ class SystemState:
         Returns:
             The value of the input signal
         """
-        return self.inputs[signal.input_slice].reshape(signal.shape)
+        return self.inputs[signal.input_slice].reshape(
+            signal.shape + self.inputs.shape[1:])
 
     def __getitem__(self, key):
         warnings.warn("The dictionary access interface is deprecated",
@@ -2,10 +2,12 @@
 Provide classes for simulation.
 """
 from collections.abc import Sequence
+import inspect
 import warnings
 
 import numpy as np
 import scipy.integrate
+import scipy.linalg
 import scipy.optimize
 
 from modypy.model import State, InputSignal, SystemState
@@ -13,7 +15,7 @@ from modypy.model.events import ClockQueue
 from modypy.model.system import System
 
 INITIAL_RESULT_SIZE = 16
-RESULT_SIZE_EXTENSION = 16
+RESULT_FLUSH_SIZE = 64
 
 DEFAULT_INTEGRATOR = scipy.integrate.DOP853
 
@@ -38,32 +40,48 @@ class SimulationResult(Sequence):
     A `SimulationResult` object captures the time series provided by a
     simulation. It has properties `t`, `state` and `inputs` representing the
     time, state vector and inputs vector for each individual sample.
+
+    Args:
+        system: The system the results belong to
+        source: An optional iterable providing system states to collect
+        estimated_steps: An optional estimate of the number of samples to be
+            stored, used for pre-allocating the storage space
     """
 
-    def __init__(self, system: System, source=None):
+    def __init__(self, system: System, source=None, estimated_steps=None):
         self.system = system
-        self._t = np.empty(INITIAL_RESULT_SIZE)
-        self._inputs = np.empty((self.system.num_inputs, INITIAL_RESULT_SIZE))
-        self._state = np.empty((self.system.num_states, INITIAL_RESULT_SIZE))
+        if estimated_steps is None:
+            estimated_steps = INITIAL_RESULT_SIZE
+        self._t = np.empty(estimated_steps)
+        self._inputs = np.empty((self.system.num_inputs, estimated_steps))
+        self._state = np.empty((self.system.num_states, estimated_steps))
 
         self.current_idx = 0
 
+        # Appended entries are buffered and written to the storage in batches
+        self._pending_time = list()
+        self._pending_inputs = list()
+        self._pending_state = list()
+
         if source is not None:
             self.collect_from(source)
 
     @property
     def time(self):
         """The time vector of the simulation result"""
+        self._flush()
         return self._t[0 : self.current_idx]
 
     @property
     def inputs(self):
         """The input vector of the simulation result"""
+        self._flush()
         return self._inputs[:, 0 : self.current_idx]
 
     @property
     def state(self):
         """The state vector of the simulation result"""
+        self._flush()
         return self._state[:, 0 : self.current_idx]
 
     def collect_from(self, source):
@@ -74,6 +92,7 @@ class SimulationResult(Sequence):
 
         for state in source:
             self.append(state)
+        self.trim()
 
     def append(self, system_state):
         """Append an entry to the result vectors.
@@ -92,25 +111,70 @@ class SimulationResult(Sequence):
           state: The state vector
         """
 
-        if self.current_idx >= self._t.size:
+        # Entries are written to the result vectors only in batches, so we
+        # need to copy the vectors, as the caller may modify them in the
+        # meantime.
+        self._pending_time.append(time)
+        self._pending_inputs.append(np.array(inputs, dtype=float))
+        self._pending_state.append(np.array(state, dtype=float))
+        if len(self._pending_time) >= RESULT_FLUSH_SIZE:
+            self._flush()
+
+    def _flush(self):
+        """Write the buffered entries to the result vectors"""
+
+        count = len(self._pending_time)
+        if count == 0:
+            return
+
+        while self.current_idx + count > self._t.size:
             self.extend_space()
-        self._t[self.current_idx] = time
-        self._inputs[:, self.current_idx] = inputs
-        self._state[:, self.current_idx] = state
+        end_idx = self.current_idx + count
+        self._t[self.current_idx : end_idx] = self._pending_time
+        self._inputs[:, self.current_idx : end_idx] = np.transpose(
+            self._pending_inputs
+        )
+        self._state[:, self.current_idx : end_idx] = np.transpose(
+            self._pending_state
+        )
+        self.current_idx = end_idx
 
-        self.current_idx += 1
+        self._pending_time.clear()
+        self._pending_inputs.clear()
+        self._pending_state.clear()
 
     def extend_space(self):
-        """Extend the storage space for the vectors"""
-        self._t = np.r_[self._t, np.empty(RESULT_SIZE_EXTENSION)]
-        self._inputs = np.c_[
-            self._inputs,
-            np.empty((self.system.num_inputs, RESULT_SIZE_EXTENSION)),
-        ]
-        self._state = np.c_[
-            self._state,
-            np.empty((self.system.num_states, RESULT_SIZE_EXTENSION)),
-        ]
+        """Extend the storage space for the vectors
+
+        The storage space is doubled on each extension, so that the total
+        effort for copying is linear in the number of samples."""
+        self._resize_space(max(2 * self._t.size, self._t.size + 1))
+
+    def trim(self):
+        """Release the storage space not occupied by samples"""
+        self._flush()
+        self._resize_space(self.current_idx)
+
+    def _resize_space(self, size):
+        """Re-allocate the storage space for the vectors, keeping the samples
+        already stored.
+
+        Args:
+            size: The new number of samples to provide space for
+        """
+        count = min(self.current_idx, size)
+
+        new_t = np.empty(size)
+        new_t[:count] = self._t[:count]
+        self._t = new_t
+
+        new_inputs = np.empty((self.system.num_inputs, size))
+        new_inputs[:, :count] = self._inputs[:, :count]
+        self._inputs = new_inputs
+
+        new_state = np.empty((self.system.num_states, size))
+        new_state[:, :count] = self._state[:, :count]
+        self._state = new_state
 
     def get_state_value(self, state: State):
         """Determine the value of the given state in this result object"""
@@ -149,7 +213,7 @@ class SimulationResult(Sequence):
             return key(self)
 
     def __len__(self):
-        return self.current_idx
+        return self.current_idx + len(self._pending_time)
 
 
 class Simulator:
@@ -175,12 +239,29 @@ class Simulator:
         event_maxiter:
             The maximum number of iterations for identifying the time of a
             zero-crossing event.
-        solver:
+        solver_method:
             The solver to be used for integrating continuous-time systems.
             The default is the :class:`DOP853 <scipy.integrate.DOP853>`
-            solver.
+            solver. For stiff systems, an implicit solver such as
+            :class:`LSODA <scipy.integrate.LSODA>`,
+            :class:`Radau <scipy.integrate.Radau>` or
+            :class:`BDF <scipy.integrate.BDF>` may be considerably faster.
         solver_options:
-            Options to be passed to the solver constructor.
+            Options to be passed to the solver constructor, e.g. the
+            tolerances ``rtol`` and ``atol``. The step size control of the
+            solver works best with tolerances that are realistic for the
+            problem at hand, as overly tight tolerances lead to excessively
+            small steps. Unless ``first_step`` is given, solvers re-created
+            after clock ticks and events start with the step size proposed by
+            their predecessor. Pass ``first_step=None`` to have the solver
+            select the initial step size each time instead.
+
+    If the system defines a :attr:`jacobian_function
+    <modypy.model.system.System.jacobian_function>`, it is passed to the
+    solver as the ``jac`` option, unless that option is explicitly given or
+    the solver does not accept it. Note that only the implicit solvers such as
+    :class:`Radau <scipy.integrate.Radau>`, :class:`BDF <scipy.integrate.BDF>`
+    and :class:`LSODA <scipy.integrate.LSODA>` make use of the Jacobian.
     """
 
     def __init__(
@@ -204,6 +285,15 @@ class Simulator:
         self.solver_method = solver_method
         self.solver_options = solver_options
 
+        # Provide the analytic Jacobian to the solver, if one is available and
+        # the solver makes use of it
+        if (
+            self.system.jacobian_function is not None
+            and "jac" not in self.solver_options
+            and _accepts_keyword(self.solver_method, "jac")
+        ):
+            self.solver_options["jac"] = self._state_jacobian
+
         # Initialize the simulation state
         self.current_time = start_time
         if initial_condition is not None:
@@ -223,10 +313,25 @@ class Simulator:
             [event.direction for event in self.system.events]
         )
 
-        # Check if we have continuous-time states
-        self.have_continuous_time_states = any(
-            state.derivative_function is not None
+        # Collect the derivative functions together with the state lines they
+        # apply to, so that evaluating the state derivative does not require
+        # walking through all the states of the system each time.
+        self._derivative_functions = [
+            (state.state_slice, state.derivative_function)
             for state in self.system.states
+            if state.derivative_function is not None
+        ]
+
+        # Check if we have continuous-time states
+        self.have_continuous_time_states = len(self._derivative_functions) > 0
+
+        # The state derivative function is called very often by the solver, so
+        # we create it as a plain function that has all the information it
+        # requires bound to local names.
+        self._state_derivative = _make_state_derivative_function(
+            system=self.system,
+            derivative_functions=self._derivative_functions,
+            inputs=self.current_inputs,
         )
 
         # Create the clock queue
@@ -272,6 +377,122 @@ class Simulator:
                 inputs=self.current_inputs,
             )
 
+    def run_batch(self, initial_conditions, time_boundary, include_last=True):
+        """Run the simulation for a batch of initial conditions at once
+
+        All the members of the batch are integrated by a single solver
+        instance, starting at the current time of the simulator. The state of
+        the simulator itself is not modified.
+
+        The states are passed to the derivative functions with an additional
+        trailing axis for the members of the batch, the same way as for
+        evaluation on a :class:`SimulationResult`. Thus, all the derivative
+        functions and signals in the system must support broadcasting over a
+        trailing axis according to the usual NumPy broadcasting rules. For
+        example, a 3x3 matrix must be applied to a vector-valued state using
+        ``np.einsum("ij,j...->i...", matrix, value)`` instead of ``matrix @
+        value``.
+
+        Yields a series of :class:`modypy.model.system.SystemState` objects
+        with each element representing one time sample of the process. The
+        state vectors of these objects have shape ``(num_states, batch_size)``.
+
+        Args:
+            initial_conditions:
+                The initial conditions of the members of the batch, as a
+                matrix of shape ``(batch_size, num_states)``.
+            time_boundary:
+                The end time of the simulation.
+            include_last:
+                Flag indicating whether the state at the end of simulation shall
+                be yielded as well.
+
+        Raises:
+            ValueError: if the initial conditions are not a matrix with one
+                row per member of the batch and one column per state line
+            SimulationError: if the system has events or clocks, or an error
+                occurs during simulation
+        """
+
+        if len(self.system.events) > 0 or len(self.system.clocks) > 0:
+            raise SimulationError(
+                "Batch simulation is not supported for systems with events "
+                "or clocks"
+            )
+
+        initial_conditions = np.asarray(initial_conditions, dtype=float)
+        if (
+            initial_conditions.ndim != 2
+            or initial_conditions.shape[1] != self.system.num_states
+        ):
+            raise ValueError(
+                "The initial conditions must be a matrix of shape "
+                "(batch_size, %d), but have shape %s"
+                % (self.system.num_states, initial_conditions.shape)
+            )
+        batch_size = initial_conditions.shape[0]
+        inputs = np.repeat(
+            self.current_inputs[:, np.newaxis], batch_size, axis=1
+        )
+
+        def _batch_state_derivative(time, flat_state):
+            # The solver works on the concatenation of all batch members'
+            # state vectors, while we evaluate the system on one state vector
+            # per column.
+            state = flat_state.reshape(batch_size, -1).T
+            return self._state_derivative(time, state).T.ravel()
+
+        # The Jacobian of the batch is block-diagonal, with one block for each
+        # batch member.
+        solver_options = dict(self.solver_options)
+        jacobian = solver_options.get("jac")
+        if callable(jacobian):
+
+            def _batch_jacobian(time, flat_state):
+                return scipy.linalg.block_diag(
+                    *(
+                        jacobian(time, member_state)
+                        for member_state in flat_state.reshape(batch_size, -1)
+                    )
+                )
+
+            solver_options["jac"] = _batch_jacobian
+        elif jacobian is not None:
+            solver_options["jac"] = np.kron(np.eye(batch_size), jacobian)
+
+        current_time = self.current_time
+        current_state = initial_conditions.T
+        if self.have_continuous_time_states and current_time < time_boundary:
+            solver = self.solver_method(
+                fun=_batch_state_derivative,
+                t0=current_time,
+                y0=initial_conditions.ravel(),
+                t_bound=time_boundary,
+                **solver_options
+            )
+            while current_time < time_boundary:
+                yield SystemState(
+                    system=self.system,
+                    time=current_time,
+                    state=current_state,
+                    inputs=inputs,
+                )
+                msg = solver.step()
+                if msg is not None:
+                    raise IntegrationError(msg)
+                current_time = solver.t
+                current_state = solver.y.reshape(batch_size, -1).T
+        else:
+            current_time = max(current_time, time_boundary)
+
+        if include_last:
+            yield SystemState(
+                system=self.system,
+                time=current_time,
+                state=current_state,
+                inputs=inputs,
+            )
+
     def _run_mixed_model_simulation(self, time_boundary):
         # The outer loop iterates over solver instances as necessary.
         # Events leading to state changes will invalidate the solver, so
@@ -295,45 +516,116 @@ class Simulator:
             system=self.system, events=non_terminating_events
         )
 
+        # The step size proposed by the previous solver instance for its next
+        # step, if any
+        last_step_size = None
+
+        # Bind frequently used attributes to local names for the inner loop
+        system = self.system
+
+        # Without zero-crossing events, there is no need for localizing events
+        # and thus no need for the dense output of the solver, which would
+        # otherwise be calculated for every step.
+        have_events = len(system.events) > 0
+
+        # The inputs do not change during integration
+        def _input_interpolator(_t):
+            if np.ndim(_t) > 0:
+                return np.broadcast_to(
+                    self.current_inputs[:, np.newaxis],
+                    (system.num_inputs, np.size(_t)),
+                )
+            return self.current_inputs
+
         while self.current_time < time_boundary:
             terminated = False
 
+            # The state may have been changed by clock ticks or event
+            # listeners, so the event values known from the last step are not
+            # valid anymore.
+            terminating_detector.clear_cache()
+            non_terminating_detector.clear_cache()
+
             # The solver can run to the time boundary or the next clock tick,
             # whichever comes first.
             solver_bound = self.clock_queue.next_clock_tick
             if solver_bound is None or solver_bound > time_boundary:
                 solver_bound = time_boundary
 
+            # Let the new solver start with the step size of the previous
+            # solver instance. This avoids the effort for selecting an initial
+            # step size whenever the solver has to be re-created.
+            solver_options = self.solver_options
+            if (
+                last_step_size is not None
+                and "first_step" not in solver_options
+            ):
+                solver_options = dict(
+                    solver_options,
+                    first_step=min(
+                        last_step_size, solver_bound - self.current_time
+                    ),
+                )
+
             # Create the solver
+            # Note that we do not declare the state derivative as vectorized,
+            # as not all blocks support evaluation for multiple states at once
+            # and, more importantly, vectorized solvers pass the state vector
+            # as a single-column matrix also for non-vectorized evaluations.
             solver = self.solver_method(
                 fun=self._state_derivative,
                 t0=self.current_time,
                 y0=self.current_state,
                 t_bound=solver_bound,
-                vectorized=True,
-                **self.solver_options
+                **solver_options
             )
+            solver_step = solver.step
 
             # Run the integration until the determined time limit
             while self.current_time < solver_bound and not terminated:
                 # Yield the current state (after running the clock ticks)
                 yield SystemState(
-                    system=self.system,
+                    system=system,
                     time=self.current_time,
                     inputs=self.current_inputs,
                     state=self.current_state,
                 )
 
                 # Perform a solver step
-                msg = solver.step()
+                proposed_step_size = getattr(solver, "h_abs", None)
+                msg = solver_step()
                 if msg is not None:
                     raise IntegrationError(msg)
 
-                # Get interpolation functions for state and inputs
-                state_interpolator = solver.dense_output()
+                # Remember the step size the solver proposes for its next step.
+                # The scipy solvers keep this proposal in their h_abs
+                # attribute, which is internal to scipy and not part of the
+                # OdeSolver interface. If the step was cut short by the solver
+                # bound, the proposal is based on the shortened step, so the
+                # proposal made before the step may be larger.
+                # For solvers not providing h_abs, we fall back to the size of
+                # the last step, unless it was cut short by the solver bound.
+                cut_short = solver.t >= solver_bound
+                next_step_size = getattr(solver, "h_abs", None)
+                if next_step_size is not None:
+                    if cut_short and proposed_step_size is not None:
+                        next_step_size = max(next_step_size, proposed_step_size)
+                    last_step_size = next_step_size
+                elif not cut_short:
+                    last_step_size = getattr(solver, "step_size", None)
+
+                if not have_events:
+                    # Advance time to the end of the integration step
+                    self.current_time = solver.t
+                    self.current_state = solver.y
+                    self.successive_event_count = 0
+                    continue
 
-                def _input_interpolator(_t):
-                    return self.current_inputs
+                # Get the interpolation function for the state
+                # The state interpolator caches its results, as the event
+                # detectors as well as the handling of detected events
+                # repeatedly require the state at the same times.
+                state_interpolator = _CachingInterpolator(solver.dense_output())
 
                 # Check for occurrence of a terminating event and determine the
                 # time of the earliest terminating event.
@@ -363,7 +655,7 @@ class Simulator:
                 non_term_occs.sort(key=lambda v: v[0])
                 for time, event in non_term_occs:
                     event_state = SystemState(
-                        system=self.system,
+                        system=system,
                         time=time,
                         state=state_interpolator(time),
                         inputs=_input_interpolator(time),
@@ -429,6 +721,12 @@ class Simulator:
     def _run_event_listeners(self, event_sources):
         """Run the event listeners on the given events."""
 
+        # The values of the event functions before running the listeners.
+        # After the first round, these are the values determined after the
+        # preceding round of listeners, as time and state have not changed
+        # since then.
+        last_event_values = None
+
         while len(event_sources) > 0:
             # Check for excessive counts of successive events
             self.successive_event_count += 1
@@ -444,8 +742,9 @@ class Simulator:
             )
 
             # Determine the values of all event functions before running the
-            # event listeners.
-            last_event_values = self.system.event_values(state_updater)
+            # event listeners, unless we already know them.
+            if last_event_values is None:
+                last_event_values = self.system.event_values(state_updater)
 
             # Collect all listeners associated with the events
             # Note that we run each listener only once, even if it is associated
@@ -486,23 +785,108 @@ class Simulator:
                 ]
             else:
                 event_sources = []
+            last_event_values = new_event_values
 
-    def _state_derivative(self, time, state):
+    def _state_jacobian(self, time, state):
+        """The Jacobian of the state derivative function with respect to the
+        state vector.
+
+        Args:
+          time: The current time
+          state: The current state vector
+
+        Returns:
+          The Jacobian matrix of the state derivative
+        """
+
+        system_state = SystemState(
+            system=self.system,
+            time=time,
+            state=state,
+            inputs=self.current_inputs,
+        )
+        return self.system.state_jacobian(system_state)
+
+
+def _accepts_keyword(function, name):
+    """Determine whether the given function explicitly accepts a keyword
+    argument of the given name.
+
+    Args:
+        function: The function (or class) to check
+        name: The name of the keyword argument
+
+    Returns:
+        ``True`` if the function has a parameter of the given name, ``False``
+        otherwise or if the signature cannot be determined
+    """
+
+    try:
+        parameters = inspect.signature(function).parameters
+    except (TypeError, ValueError):
+        return False
+    parameter = parameters.get(name)
+    return parameter is not None and parameter.kind in (
+        inspect.Parameter.POSITIONAL_OR_KEYWORD,
+        inspect.Parameter.KEYWORD_ONLY,
+    )
+
+
+def _make_state_derivative_function(system, derivative_functions, inputs):
+    """Create the state derivative function used for integrating the state of
+    a system over time.
+
+    Args:
+        system: The system
+        derivative_functions: A list of tuples ``(state_slice, function)``
+            with the derivative function of each continuous-time state and the
+            slice of the state vector it applies to
+        inputs: The input vector, which does not change during integration
+
+    Returns:
+        A function ``f(time, state)`` calculating the time-derivative of the
+        state vector ``state`` at time ``time``
+    """
+
+    # For evaluating multiple states at once, the inputs need a trailing axis
+    # to be broadcast against the states.
+    column_inputs = inputs[:, np.newaxis]
+
+    def _state_derivative(time, state):
         """The state derivative function used for integrating the state over
         time.
 
         Args:
           time: The current time
-          state: The current state vector
+          state: The current state vector, or a matrix with one state vector
+            per column
 
         Returns:
-          The time-derivative of the state vector
+          The time-derivative of the state vector, or a matrix with the
+          time-derivative of one state vector per column
         """
 
-        system_state = SystemState(system=self.system, time=time, state=state)
-        state_derivative = self.system.state_derivative(system_state)
+        multiple_states = state.ndim > 1
+        system_state = SystemState(
+            system=system,
+            time=time,
+            state=state,
+            inputs=column_inputs if multiple_states else inputs,
+        )
+        state_derivative = np.zeros(state.shape)
+        for state_slice, derivative_function in derivative_functions:
+            value = derivative_function(system_state)
+            if multiple_states:
+                value = np.reshape(
+                    value, (state_slice.stop - state_slice.start, -1)
+                )
+            else:
+                value = np.ravel(value)
+            state_derivative[state_slice] = value
         return state_derivative
 
+    return _state_derivative
+
 
 class _EventDetector:
     """Helper class for detecting and localizing events"""
@@ -515,6 +899,20 @@ class _EventDetector:
         self.event_tolerances = np.array([event.tolerance for event in events])
         self.event_directions = np.array([event.direction for event in events])
 
+        # The time and the event values at the end of the last time frame
+        # checked. These are re-used as start values if the next time frame
+        # starts at the same time.
+        self._last_end_time = None
+        self._last_end_values = None
+
+    def clear_cache(self):
+        """Forget the event values of the last time frame checked.
+
+        This must be called whenever the state changes other than by
+        integration, e.g. by running event listeners."""
+        self._last_end_time = None
+        self._last_end_values = None
+
     def localize_first_event(self, start_time, end_time, state, inputs):
         """Localize the first event occurring in the given time frame.
 
@@ -558,58 +956,85 @@ class _EventDetector:
             A list of tuples `(time, event)`, giving time and event object for
             each event having occurred in the given time frame.
         """
-        start_state = SystemState(
-            system=self.system,
-            time=start_time,
-            state=state(start_time),
-            inputs=inputs(start_time),
-        )
-        end_state = SystemState(
-            system=self.system,
-            time=end_time,
-            state=state(end_time),
-            inputs=inputs(end_time),
-        )
+        if len(self.events) == 0:
+            return []
+
+        if start_time == self._last_end_time:
+            start_values = self._last_end_values
+        else:
+            start_values = self._get_event_values(start_time, state, inputs)
+        end_values = self._get_event_values(end_time, state, inputs)
+        self._last_end_time = end_time
+        self._last_end_values = end_values
 
         # Determine the list of active events
-        active_events = self._get_active_events(start_state, end_state)
+        mask = _find_active_events(
+            start_values,
+            end_values,
+            self.event_tolerances,
+            self.event_directions,
+        )
 
-        # For each of the active events, localize the zero-crossing
-        locations = list()
-        for event in active_events:
-            event_time = self._find_event_time(
-                event, start_time, end_time, state, inputs
-            )
-            locations.append((event_time, event))
-        return locations
+        # Localize the zero-crossings of all the active events
+        active_indices = np.flatnonzero(mask)
+        if len(active_indices) == 0:
+            return []
+        active_events = [self.events[idx] for idx in active_indices]
+        event_times = self._find_event_times(
+            active_events,
+            start_time,
+            end_time,
+            start_values[active_indices],
+            end_values[active_indices],
+            state,
+            inputs,
+        )
+        return list(zip(event_times, active_events))
 
-    def _get_active_events(self, start_state, end_state):
-        """Determine which events are active in the given time frame.
+    def _get_event_values(self, time, state, inputs):
+        """Determine the values of the event functions at the given time.
 
         Args:
-            start_state: The state at the beginning of the time frame.
-            end_state: The state at the end of the time frame.
+            time: The time for which to determine the event values.
+            state:
+                A callable, with `state(t)` being the state vector at time `t`.
+            inputs:
+                A callable, with `state(t)` being the input vector at time `t`.
         Returns:
-            List of events that have occurred in the given time frame.
+            The vector of event function values.
         """
-        start_values = np.array([event(start_state) for event in self.events])
-        end_values = np.array([event(end_state) for event in self.events])
-
-        mask = _find_active_events(
-            start_values,
-            end_values,
-            self.event_tolerances,
-            self.event_directions,
+        system_state = SystemState(
+            system=self.system,
+            time=time,
+            state=state(time),
+            inputs=inputs(time),
         )
-        return [event for event, flag in zip(self.events, mask) if flag]
+        return np.array([event(system_state) for event in self.events])
 
-    def _find_event_time(self, event, start_time, end_time, state, inputs):
+    def _find_event_times(
+        self,
+        events,
+        start_time,
+        end_time,
+        start_values,
+        end_values,
+        state,
+        inputs,
+    ):
         """
-        Find the time when the sign change occurs.
+        Find the times when the sign changes of the given events occur.
+
+        The zero-crossings of all events are localized simultaneously by
+        bisection. As all events share the same time frame, the intervals of
+        all events are halved in each iteration, and the state is interpolated
+        only once per iteration for all the events.
 
         Args:
+            events: The list of events for which a sign change occurred
             start_time: The start time of the time frame.
             end_time: The end time of the time_frame.
+            start_values: The values of the event functions at the start time.
+            end_values: The values of the event functions at the end time.
             state:
                 A callable, with `state(t)` being the state vector at time `t`
                 for any scalar or one-dimensional array `t` with
@@ -619,49 +1044,83 @@ class _EventDetector:
                 for any scalar or one-dimensional array `t` with
                 `start_time <= t <= end_time`.
         Returns:
-            A time at or after the sign change occurs
+            An array containing, for each event, a time at or after the sign
+            change occurs
         """
 
         assert start_time <= end_time
 
-        start_state = SystemState(
-            system=self.system,
-            time=start_time,
-            state=state(start_time),
-            inputs=inputs(start_time),
-        )
-        end_state = SystemState(
-            system=self.system,
-            time=end_time,
-            state=state(end_time),
-            inputs=inputs(end_time),
+        tolerances = np.array([event.tolerance for event in events])
+        assert all(
+            ((start_values < -tolerances) ^ (end_values < -tolerances))
+            | ((tolerances < start_values) ^ (tolerances < end_values))
         )
 
-        start_value = event(start_state)
-        end_value = event(end_state)
-
-        assert (
-            (start_value < -event.tolerance) ^ (end_value < -event.tolerance)
-        ) | ((event.tolerance < start_value) ^ (event.tolerance < end_value))
+        # The signs of the start values are the reference for the bisection,
+        # so we determine them only once.
+        start_positive = start_values > 0
+        start_negative = start_values < 0
 
+        start_times = np.full(len(events), start_time, dtype=float)
         iter_count = 0
         time_diff = end_time - start_time
         while iter_count < self.maxiter and time_diff > self.xtol:
             time_diff /= 2
-            mid_time = start_time + time_diff
-            mid_state = SystemState(
-                system=self.system,
-                time=mid_time,
-                state=state(mid_time),
-                inputs=inputs(mid_time),
+            mid_times = start_times + time_diff
+            mid_states = state(mid_times)
+            mid_inputs = inputs(mid_times)
+            mid_values = np.array(
+                [
+                    event(
+                        SystemState(
+                            system=self.system,
+                            time=mid_times[idx],
+                            state=mid_states[:, idx],
+                            inputs=mid_inputs[:, idx],
+                        )
+                    )
+                    for idx, event in enumerate(events)
+                ],
+                dtype=float,
+            ).reshape(len(events))
+            # Values within the tolerance are considered to be zero
+            mid_positive = (mid_values > 0) & (mid_values >= tolerances)
+            mid_negative = (mid_values < 0) & (mid_values <= -tolerances)
+            # For the events where the sign did not change yet, the sign change
+            # happens after mid_time
+            same_sign = (mid_positive == start_positive) & (
+                mid_negative == start_negative
             )
-            mid_value = event(mid_state)
-            mid_value = 0 if np.abs(mid_value) < event.tolerance else mid_value
-            if np.sign(mid_value) == np.sign(start_value):
-                # The sign change happens after mid_time
-                start_time = mid_time
+            start_times = np.where(same_sign, mid_times, start_times)
             iter_count += 1
-        return start_time
+        return start_times
+
+
+class _CachingInterpolator:
+    """Wrapper for an interpolator that remembers the interpolated values for
+    all the times it has been evaluated for.
+
+    Args:
+        interpolator: A callable, with `interpolator(t)` being the interpolated
+            vector at time `t` for any scalar or one-dimensional array `t`.
+    """
+
+    def __init__(self, interpolator):
+        self.interpolator = interpolator
+        self.cache = dict()
+
+    def __call__(self, time):
+        if np.ndim(time) > 0:
+            values = self.interpolator(time)
+            for idx, single_time in enumerate(time):
+                self.cache[single_time] = values[:, idx]
+            return values
+
+        value = self.cache.get(time)
+        if value is None:
+            value = self.interpolator(time)
+            self.cache[time] = value
+        return value
 
 
 class _SystemStateUpdater(SystemState):
@@ -705,11 +1164,16 @@ def _find_active_events(start_values, end_values, tolerances, directions):
         sign change or not.
     """
 
-    up = ((start_values < -tolerances) & (end_values >= -tolerances)) | (
-        (start_values <= tolerances) & (end_values > tolerances)
+    # Classify the values as negative (-1), zero (0) or positive (1), with
+    # values within the tolerance considered to be zero. An upward sign change
+    # then is an increase of the class, and a downward sign change is a
+    # decrease.
+    start_signs = (start_values > tolerances).astype(np.int8) - (
+        start_values < -tolerances
     )
-    down = ((start_values >= -tolerances) & (end_values < -tolerances)) | (
-        (start_values > tolerances) & (end_values <= tolerances)
+    end_signs = (end_values > tolerances).astype(np.int8) - (
+        end_values < -tolerances
     )
-    mask = (up & (directions >= 0)) | (down & (directions <= 0))
+    sign_change = end_signs - start_signs
+    mask = (sign_change != 0) & (sign_change * directions >= 0)
     return mask
@@ -172,3 +172,33 @@ def test_signal_method():
     assert isinstance(signal_1, Signal)
     assert signal_1 is signal_2
     assert signal_1 is not signal_3
+
+    # Ensure that the signal is stored in the object itself
+    assert vars(test_object_1)["test_method"] is signal_1
+
+
+def test_signal_method_without_single_name():
+    """Test signal methods that are not known under exactly one name"""
+
+    class TestClass:
+        @signal_method
+        def test_method(self, data):
+            pass
+
+        alias_method = test_method
+
+    def _late_method(self, data):
+        pass
+
+    TestClass.late_method = signal_method(_late_method)
+
+    test_object = TestClass()
+    signal_1 = test_object.test_method
+    signal_2 = test_object.alias_method
+    signal_3 = test_object.late_method
+
+    assert isinstance(signal_1, Signal)
+    assert signal_1 is test_object.test_method
+    assert signal_1 is signal_2
+    assert isinstance(signal_3, Signal)
+    assert signal_3 is test_object.late_method
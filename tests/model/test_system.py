@@ -189,3 +189,17 @@ def test_system_state_dictionary_access():
     npt.assert_equal(system_state[state_b, 0], state_b(system_state)[0])
     npt.assert_equal(system_state[state_b, 1], state_b(system_state)[1])
     npt.assert_equal(system_state[state_c, 0, 0], state_c(system_state)[0, 0])
+
+
+def test_state_jacobian():
+    """Test the ``state_jacobian`` method of the ``System`` class"""
+
+    system = System()
+    State(system, shape=2, derivative_function=None)
+
+    system_state = SystemState(time=0, system=system)
+    assert system.state_jacobian(system_state) is None
+
+    system.jacobian_function = (lambda data: [[0, 1], [-1, 0]])
+    npt.assert_equal(system.state_jacobian(system_state),
+                     [[0, 1], [-1, 0]])
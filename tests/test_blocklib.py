@@ -8,7 +8,7 @@ from modypy.blocks.elmech import DCMotor
 from modypy.blocks.linear import sum_signal
 from modypy.blocks.rigid import DirectCosineToEuler, RigidBody6DOFFlatEarth
 from modypy.blocks.sources import constant
-from modypy.model import InputSignal, System
+from modypy.model import InputSignal, Signal, System, SystemState
 from modypy.simulation import Simulator
 from modypy.steady_state import SteadyStateConfiguration, find_steady_state
 from numpy import testing as npt
@@ -73,6 +73,74 @@ def test_aerodyn_blocks(thrust_coefficient, power_coefficient):
     )
 
 
+def test_propeller_reconfiguration():
+    system = System()
+    propeller = Propeller(
+        system, thrust_coefficient=0.09, power_coefficient=0.04, diameter=1.0
+    )
+    speed = Signal(value=2.0)
+    density = Signal(value=1.5)
+    speed.connect(propeller.speed_rps)
+    density.connect(propeller.density)
+
+    system_state = SystemState(time=0, system=system)
+
+    # Changes of the configuration must be reflected in the outputs
+    propeller.diameter = 0.5
+    propeller.thrust_coefficient = lambda n: 0.1 * n
+    propeller.power_coefficient = 0.05
+    npt.assert_almost_equal(
+        propeller.thrust(system_state), 0.2 * 1.5 * 0.5 ** 4 * 2.0 ** 2
+    )
+    npt.assert_almost_equal(
+        propeller.torque(system_state),
+        0.05 / (2 * math.pi) * 1.5 * 0.5 ** 5 * 2.0 ** 2,
+    )
+    npt.assert_almost_equal(
+        propeller.power(system_state), 0.05 * 1.5 * 0.5 ** 5 * 2.0 ** 3
+    )
+    assert propeller.power_coefficient(2.0) == 0.05
+
+
+def test_thruster():
+    system = System()
+    thruster = Thruster(
+        system, vector=np.c_[0, 0, -1], arm=np.c_[1, 1, 0], direction=-1
+    )
+    thrust = Signal(value=(lambda data: np.r_[1.0, 2.0]))
+    torque = Signal(value=(lambda data: np.r_[0.5, 0.25]))
+    thrust.connect(thruster.scalar_thrust)
+    torque.connect(thruster.scalar_torque)
+
+    system_state = SystemState(time=0, system=system)
+
+    # The outputs are evaluated for each of the thrust and torque values
+    thrust_vector = thruster.thrust_vector(system_state)
+    torque_vector = thruster.torque_vector(system_state)
+    assert thrust_vector.shape == (3, 2)
+    assert torque_vector.shape == (3, 2)
+    for idx, (thrust_value, torque_value) in enumerate([(1, 0.5), (2, 0.25)]):
+        ref_thrust_vector = np.r_[0, 0, -thrust_value]
+        npt.assert_almost_equal(thrust_vector[:, idx], ref_thrust_vector)
+        npt.assert_almost_equal(
+            torque_vector[:, idx],
+            -np.r_[0, 0, -torque_value]
+            + np.cross([1, 1, 0], ref_thrust_vector),
+        )
+
+    # Changes of the configuration must be reflected in the outputs
+    thruster.vector = np.r_[1, 0, 0]
+    thruster.arm = np.r_[0, 1, 0]
+    thruster.direction = 1
+    npt.assert_almost_equal(
+        thruster.thrust_vector(system_state), [[1, 2], [0, 0], [0, 0]]
+    )
+    npt.assert_almost_equal(
+        thruster.torque_vector(system_state),
+        [[0.5, 0.25], [0, 0], [-1, -2]],
+    )
+
+
 def test_rigidbody_movement():
     mass = 1.5
     omega = 2 * math.pi / 120
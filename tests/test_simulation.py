@@ -2,8 +2,10 @@
 import math
 
 import bisect
+import warnings
 import numpy as np
 import pytest
+import scipy.integrate
 import scipy.signal
 from fixtures.models import (
     BouncingBall,
@@ -12,7 +14,7 @@ from fixtures.models import (
     first_order_lag,
     first_order_lag_no_input,
 )
-from modypy.blocks.discrete import zero_order_hold
+from modypy.blocks.discrete import ZeroOrderHold, zero_order_hold
 from modypy.blocks.linear import LTISystem, integrator
 from modypy.blocks.sources import constant
 from modypy.model import (
@@ -188,6 +190,113 @@ def test_zero_crossing_event_detection():
             pass
 
 
+def test_simultaneous_event_localization():
+    """Test the localization of multiple events occurring in the same step."""
+
+    system = System()
+    state = State(system, derivative_function=(lambda data: 1))
+    ZeroCrossEventSource(system, event_function=(lambda data: state(data) - 1))
+    ZeroCrossEventSource(
+        system, event_function=(lambda data: 2 - state(data)), direction=-1
+    )
+
+    simulator = Simulator(system, start_time=0, first_step=4.0)
+    result = SimulationResult(system, simulator.run_until(time_boundary=4.0))
+
+    # The non-terminating events lead to samples at the times of the events
+    npt.assert_allclose(result.time, [0, 1, 2, 4], atol=1e-10)
+    npt.assert_allclose(state(result), [0, 1, 2, 4], atol=1e-10)
+
+
+def test_event_value_reuse():
+    """Test that the event functions are evaluated only once per step"""
+
+    system = System()
+    state = State(system, derivative_function=(lambda data: 1))
+    event_calls = []
+
+    def _event_function(data):
+        event_calls.append(data.time)
+        return state(data) + 1
+
+    terminating_event = ZeroCrossEventSource(
+        system, event_function=_event_function
+    )
+    terminating_event.register_listener(lambda data: None)
+    ZeroCrossEventSource(system, event_function=_event_function)
+
+    simulator = Simulator(system, start_time=0, max_step=0.1)
+    result = SimulationResult(system, simulator.run_until(time_boundary=10.0))
+
+    # Each event function is evaluated at the start of the simulation and at
+    # the end of each step.
+    num_steps = len(result) - 1
+    assert num_steps >= 100
+    assert len(event_calls) == 2 * (num_steps + 1)
+
+
+def test_state_interpolation_reuse():
+    """Test that the dense output of the solver is evaluated only once per step
+    if no event occurs"""
+
+    interpolation_times = []
+
+    class CountingSolver(scipy.integrate.DOP853):
+        """Solver counting the evaluations of its dense output"""
+
+        def dense_output(self):
+            interpolator = super().dense_output()
+
+            def _interpolator(time):
+                interpolation_times.append(time)
+                return interpolator(time)
+
+            return _interpolator
+
+    system = System()
+    state = State(system, derivative_function=(lambda data: 1))
+    terminating_event = ZeroCrossEventSource(
+        system, event_function=(lambda data: state(data) + 1)
+    )
+    terminating_event.register_listener(lambda data: None)
+    ZeroCrossEventSource(system, event_function=(lambda data: state(data) + 2))
+
+    simulator = Simulator(
+        system, start_time=0, solver_method=CountingSolver, max_step=0.1
+    )
+    result = SimulationResult(system, simulator.run_until(time_boundary=10.0))
+
+    # Both event detectors need the state at the start of the first step and at
+    # the end of each step, but it is interpolated only once for each of these.
+    num_steps = len(result) - 1
+    assert num_steps >= 100
+    assert len(interpolation_times) == num_steps + 1
+
+
+def test_event_cache_cleared_after_listener():
+    """Test that event values are re-evaluated after a terminating event
+    changed the state"""
+
+    system = System()
+    state = State(
+        system, derivative_function=(lambda data: -1), initial_condition=1
+    )
+    reset_event = ZeroCrossEventSource(
+        system, event_function=state, direction=-1
+    )
+    reset_event.register_listener(lambda data: state.set_value(data, 1))
+    ZeroCrossEventSource(
+        system, event_function=(lambda data: state(data) - 0.5)
+    )
+
+    simulator = Simulator(system, start_time=0)
+    result = SimulationResult(system, simulator.run_until(time_boundary=2.9))
+
+    # The non-terminating event must be detected after each reset
+    event_samples = np.isclose(state(result), 0.5)
+    npt.assert_allclose(result.time[event_samples], [0.5, 1.5, 2.5])
+
+
 def test_excessive_events_second_level():
     """Test the detection of excessive events when it is introduced by
     toggling the same event over and over."""
@@ -269,6 +378,67 @@ def test_clock_handling():
     npt.assert_almost_equal(hold3(result), initial_value)
 
 
+def test_sampling_state():
+    """Test sampling a state using a zero-order hold."""
+
+    system = System()
+    ramp = State(system, shape=2, derivative_function=(lambda data: [1, 2]))
+    clock = Clock(system, period=0.5)
+    hold = zero_order_hold(system, input_port=ramp, event_port=clock)
+
+    simulator = Simulator(system, start_time=0.0)
+    result = SimulationResult(system, simulator.run_until(time_boundary=2.0))
+
+    time_floor = np.floor(result.time / clock.period) * clock.period
+    npt.assert_almost_equal(hold(result), [time_floor, 2 * time_floor])
+
+
+def test_sampling_state_system_state():
+    """Test that sampling a state does not modify a plain system state."""
+
+    system = System()
+    ramp = State(system, shape=2, initial_condition=[1, 2])
+    hold = ZeroOrderHold(system, shape=2)
+    hold.input.connect(ramp)
+
+    system_state = SystemState(
+        time=0, system=system, state=system.initial_condition
+    )
+    with pytest.raises(AttributeError):
+        hold.update_state(system_state)
+    npt.assert_equal(hold.output(system_state), [0, 0])
+
+
+def test_clocked_solver_step_count():
+    """Test that re-created solvers continue with the step size proposed by
+    their predecessors, so that no additional steps are required between clock
+    ticks"""
+
+    system = System()
+    derivative_calls = []
+
+    def _input_derivative(system_state):
+        derivative_calls.append(system_state.time)
+        return np.cos(3 * system_state.time)
+
+    input_state = State(system, derivative_function=_input_derivative)
+    clock = Clock(system, period=0.01)
+    hold = zero_order_hold(
+        system, input_port=input_state, event_port=clock, initial_condition=0
+    )
+    lag_state = State(system)
+    lag_state.derivative_function = lambda data: hold(data) - lag_state(data)
+
+    simulator = Simulator(system, start_time=0)
+    result = SimulationResult(system, simulator.run_until(5.0))
+
+    # There should be about one solver step per clock tick
+    num_ticks = 500
+    assert len(result) <= num_ticks + 5
+    # Each step of DOP853 requires twelve evaluations of the state derivative
+    assert len(derivative_calls) <= 14 * num_ticks
+
+
 def test_discrete_only():
     """Test a system with only discrete-time states."""
 
@@ -308,6 +478,203 @@ def test_integrator():
     npt.assert_almost_equal(int_output(result).ravel(), result.time)
 
 
+def test_batch_simulation():
+    """Test the simulation of a batch of initial conditions"""
+
+    system, lti, ref_time, _ = damped_oscillator(
+        mass=100, spring_coefficient=2.0, damping_coefficient=20
+    )
+    initial_conditions = np.array([[10.0, 0.0], [0.0, 1.0], [-5.0, 2.0]])
+
+    rtol = 1e-9
+    atol = 1e-12
+    simulator = Simulator(system, start_time=0, rtol=rtol, atol=atol)
+    batch_states = list(simulator.run_batch(initial_conditions, ref_time))
+    assert batch_states[-1].time == ref_time
+    for batch_state in batch_states:
+        assert batch_state.state.shape == (system.num_states, 3)
+        assert lti.state(batch_state).shape == (2, 3)
+
+    # Compare the final states with individual simulations
+    for idx, initial_condition in enumerate(initial_conditions):
+        single_simulator = Simulator(
+            system,
+            start_time=0,
+            initial_condition=initial_condition,
+            rtol=rtol,
+            atol=atol,
+        )
+        *_, last_state = single_simulator.run_until(ref_time)
+        npt.assert_allclose(
+            batch_states[-1].state[:, idx],
+            last_state.state,
+            rtol=rtol * 1e3,
+            atol=atol * 1e3,
+        )
+
+
+@pytest.mark.parametrize("analytic_jacobian", [True, False])
+def test_batch_simulation_with_jacobian(analytic_jacobian):
+    """Test the simulation of a batch using an implicit solver and a Jacobian"""
+
+    system, lti, ref_time, _ = damped_oscillator(
+        mass=100, spring_coefficient=2.0, damping_coefficient=20
+    )
+    initial_conditions = np.array([[10.0, 0.0], [0.0, 1.0]])
+    solver_options = {}
+    if analytic_jacobian:
+        system.jacobian_function = lambda system_state: lti.system_matrix
+    else:
+        solver_options["jac"] = lti.system_matrix
+
+    rtol = 1e-9
+    atol = 1e-12
+    simulator = Simulator(
+        system,
+        start_time=0,
+        solver_method=scipy.integrate.Radau,
+        rtol=rtol,
+        atol=atol,
+        **solver_options
+    )
+    *_, last_batch_state = simulator.run_batch(initial_conditions, ref_time)
+
+    for idx, initial_condition in enumerate(initial_conditions):
+        single_simulator = Simulator(
+            system,
+            start_time=0,
+            initial_condition=initial_condition,
+            rtol=rtol,
+            atol=atol,
+        )
+        *_, last_state = single_simulator.run_until(ref_time)
+        npt.assert_allclose(
+            last_batch_state.state[:, idx],
+            last_state.state,
+            rtol=1e-5,
+            atol=1e-8,
+        )
+
+
+@pytest.mark.parametrize(
+    "initial_conditions", [[10.0, 0.0], [[10.0, 0.0, 3.0]], [[[10.0, 0.0]]]]
+)
+def test_batch_simulation_invalid_shape(initial_conditions):
+    """Test that initial conditions of invalid shape are rejected"""
+
+    system, _, ref_time, _ = damped_oscillator()
+    simulator = Simulator(system, start_time=0)
+    with pytest.raises(ValueError):
+        for _ in simulator.run_batch(initial_conditions, ref_time):
+            pass
+
+
+def test_batch_simulation_with_events():
+    """Test that batch simulation is rejected for systems with events"""
+
+    system, _, ref_time, _ = damped_oscillator_with_events()
+    simulator = Simulator(system, start_time=0)
+    with pytest.raises(SimulationError):
+        for _ in simulator.run_batch([system.initial_condition], ref_time):
+            pass
+
+
+def test_analytic_jacobian():
+    """Test passing the analytic Jacobian of a system to the solver"""
+
+    system, lti, ref_time, _ = damped_oscillator(
+        mass=100, spring_coefficient=2.0, damping_coefficient=20
+    )
+
+    jacobian_calls = []
+
+    def _jacobian(system_state):
+        jacobian_calls.append(system_state.time)
+        return lti.system_matrix
+
+    system.jacobian_function = _jacobian
+
+    simulator = Simulator(
+        system,
+        start_time=0,
+        solver_method=scipy.integrate.Radau,
+        rtol=1e-6,
+        atol=1e-9,
+    )
+    result = SimulationResult(system, simulator.run_until(ref_time))
+
+    assert len(jacobian_calls) > 0
+
+    ref_system = scipy.signal.StateSpace(
+        lti.system_matrix,
+        lti.input_matrix,
+        lti.output_matrix,
+        lti.feed_through_matrix,
+    )
+    _, _, ref_state = scipy.signal.lsim2(
+        ref_system,
+        X0=system.initial_condition,
+        T=result.time,
+        U=None,
+        rtol=1e-9,
+        atol=1e-12,
+    )
+    npt.assert_allclose(result.state, ref_state.T, rtol=1e-4, atol=1e-6)
+
+
+def test_analytic_jacobian_explicit_solver():
+    """Test that the analytic Jacobian is not passed to explicit solvers"""
+
+    system, lti, _, _ = damped_oscillator(
+        mass=100, spring_coefficient=2.0, damping_coefficient=20
+    )
+    system.jacobian_function = lambda system_state: lti.system_matrix
+    clock = Clock(system, period=0.5)
+    zero_order_hold(
+        system, input_port=lti.output, event_port=clock, initial_condition=0
+    )
+
+    simulator = Simulator(system, start_time=0)
+    assert "jac" not in simulator.solver_options
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        SimulationResult(system, simulator.run_until(5.0))
+
+
+def test_simulation_result_storage():
+    """Test the extension and trimming of the storage of simulation results"""
+
+    system = System()
+    state = State(system, shape=2)
+
+    result = SimulationResult(system, estimated_steps=3)
+    for idx in range(100):
+        result.append(
+            SystemState(time=idx, system=system, state=np.r_[idx, -idx])
+        )
+    assert len(result) == 100
+    assert result.state.shape == (2, 100)
+
+    result.trim()
+    npt.assert_equal(result.time, np.arange(100))
+    npt.assert_equal(state(result), [np.arange(100), -np.arange(100)])
+
+
+def test_simulation_result_append_copies():
+    """Test that appending to a simulation result copies the state vector"""
+
+    system = System()
+    State(system, shape=2)
+
+    result = SimulationResult(system)
+    state = np.zeros(2)
+    for idx in range(5):
+        state[:] = idx
+        result.append(SystemState(time=idx, system=system, state=state))
+
+    npt.assert_equal(result.state, [np.arange(5), np.arange(5)])
+
+
 def test_simulation_result_dictionary_access():
     """Test the deprecated dictionary access for simulation results"""
 